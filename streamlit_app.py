@@ -2,40 +2,98 @@
 Streamlit web application to find top cited papers using
 OpenAlex. This application provides an interface for
 searching the most cited academic papers by keyword or
-author using the OpenAlex API (via pyalex).
+author using the OpenAlex API.
 """
 
 import base64
 import os
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from html import escape
+from io import BytesIO
 from pathlib import Path
 
+import orjson
 import polars as pl
 import requests
 import streamlit as st
-from pyalex import Authors, Works, config
-
-
-def load_markdown_content(filename: str) -> str:
+from requests.adapters import HTTPAdapter, Retry
+
+# email for polite pool access when the user has not provided one
+DEFAULT_EMAIL = os.environ.get("OPENALEX_EMAIL", "research@example.com")
+# largest result set that can be shown as cards rather than a table
+CARD_VIEW_MAX_PAPERS = 10
+# most keywords searched at once; each one sends a single request, so a
+# search stays within OpenAlex's limit of 10 requests per second
+MAX_KEYWORDS = 9
+# OpenAlex endpoints; works are queried with build_works_params
+OPENALEX_WORKS_URL = "https://api.openalex.org/works"
+OPENALEX_AUTHORS_URL = "https://api.openalex.org/authors"
+# fields requested from OpenAlex; only these are read by the app
+WORK_FIELDS = [
+    "id",
+    "title",
+    "authorships",
+    "publication_year",
+    "cited_by_count",
+    "doi",
+    "open_access",
+    "primary_location",
+]
+AUTHOR_FIELDS = [
+    "id",
+    "display_name",
+    "works_count",
+    "cited_by_count",
+    "last_known_institutions",
+    "orcid",
+]
+# types of the OpenAlex work fields read by the app
+WORK_SCHEMA = {
+    "id": pl.String,
+    "title": pl.String,
+    "authorships": pl.List(
+        pl.Struct({"author": pl.Struct({"display_name": pl.String})})
+    ),
+    "publication_year": pl.Int64,
+    "cited_by_count": pl.Int64,
+    "doi": pl.String,
+    "open_access": pl.Struct({"is_oa": pl.Boolean}),
+    "primary_location": pl.Struct(
+        {"source": pl.Struct({"display_name": pl.String})}
+    ),
+}
+# column types of the extracted paper records
+PAPER_SCHEMA = {
+    "id": pl.String,
+    "title": pl.String,
+    "authors": pl.String,
+    "year": pl.Int64,
+    "citations": pl.Int64,
+    "doi": pl.String,
+    "url": pl.String,
+    "open_access": pl.Boolean,
+    "source": pl.String,
+}
+
+
+@st.cache_resource
+def load_markdown_contents() -> dict[str, str]:
     """
-    Load markdown content from assets/content directory.
-
-    Parameters
-    ----------
-    filename : str
-        Name of the markdown file to load.
+    Load all markdown content from assets/content directory.
 
     Returns
     -------
-    str
-        Content of the markdown file, or empty string if file not found.
+    dict[str, str]
+        Content of each markdown file, keyed by file name.
     """
-    content_path = Path(__file__).parent / "assets" / "content" / filename
-    if content_path.exists():
-        return content_path.read_text()
-    return ""
+    content_dir = Path(__file__).parent / "assets" / "content"
+    return {path.name: path.read_text() for path in content_dir.glob("*.md")}
 
 
+@st.cache_resource
 def load_font_base64(font_path: str) -> str:
     """
     Load font file and encode as base64 for CSS embedding.
@@ -76,89 +134,291 @@ if "author_info" not in st.session_state:
     st.session_state.author_info = None
 if "search_type" not in st.session_state:
     st.session_state.search_type = "keyword"
+if "search_timestamp" not in st.session_state:
+    st.session_state.search_timestamp = None
 
 
-def get_openalex_rate_limit_info(user_email: str | None = None) -> dict:
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> dict:
     """
-    Make a test request to OpenAlex to get rate limit headers.
+    Read rate limit information from OpenAlex response headers.
 
     Parameters
     ----------
-    user_email : str | None
-        User email for polite pool.
+    headers : Mapping[str, str]
+        Headers of an OpenAlex API response.
 
     Returns
     -------
     dict
         Rate limit information from OpenAlex headers.
     """
-    email = user_email or os.environ.get(
-        "OPENALEX_EMAIL", "research@example.com"
+    limit = headers.get(
+        "ratelimit-limit", headers.get("x-ratelimit-limit", "unknown")
+    )
+    remaining = headers.get(
+        "ratelimit-remaining",
+        headers.get("x-ratelimit-remaining", "unknown"),
     )
 
-    url = "https://api.openalex.org/works"
-    params = {"per-page": 1, "mailto": email}
+    return {
+        "rate_limit_limit": limit,
+        "rate_limit_remaining": remaining,
+    }
 
-    try:
-        response = requests.get(url, params=params, timeout=5)
-        headers = response.headers
 
-        limit = headers.get(
-            "ratelimit-limit", headers.get("x-ratelimit-limit", "unknown")
-        )
-        remaining = headers.get(
-            "ratelimit-remaining",
-            headers.get("x-ratelimit-remaining", "unknown"),
+@st.cache_resource
+def get_openalex_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all OpenAlex requests, so that
+    connections (and their TLS handshakes) are reused across searches.
+
+    Returns
+    -------
+    requests.Session
+        Session with connection pooling and retry configuration.
+    """
+    retries = Retry(
+        total=3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        backoff_factor=0.3,
+        respect_retry_after_header=True,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries),
+    )
+    return session
+
+
+@st.cache_resource
+def get_rate_limit_status() -> dict[str, dict]:
+    """
+    Create the record of the rate limit information reported by the
+    latest OpenAlex response for each email, since OpenAlex assigns
+    requests to a pool by email. It is kept apart from the cached
+    search results so that it is never older than the latest request.
+
+    Returns
+    -------
+    dict[str, dict]
+        Rate limit information keyed by the email sent, updated by
+        fetch_openalex.
+    """
+    return {}
+
+
+# OpenAlex requests sent by each thread, to tell whether a search was
+# answered from the cache
+sent_requests = threading.local()
+
+
+def fetch_openalex(
+    url: str, params: Mapping[str, str | int], email: str
+) -> list[dict]:
+    """
+    Fetch the results of an OpenAlex query, recording the rate limit
+    information reported on the same response.
+
+    Parameters
+    ----------
+    url : str
+        OpenAlex endpoint URL.
+    params : Mapping[str, str | int]
+        Query parameters to add to the URL, such as "per-page".
+    email : str
+        Email for polite pool access.
+
+    Returns
+    -------
+    list[dict]
+        List of result objects.
+    """
+    response = get_openalex_session().get(
+        url, params={**params, "mailto": email}, timeout=30
+    )
+    get_rate_limit_status()[email] = {
+        **parse_rate_limit_headers(response.headers),
+        "checked_at": datetime.now().strftime("%H:%M:%S"),
+    }
+    sent_requests.count = getattr(sent_requests, "count", 0) + 1
+    response.raise_for_status()
+
+    # orjson parses the (potentially large) body several times faster
+    return orjson.loads(response.content)["results"]
+
+
+def build_papers_frame(works: list[dict]) -> pl.DataFrame:
+    """
+    Extract the relevant fields of OpenAlex works into a DataFrame.
+
+    Parameters
+    ----------
+    works : list[dict]
+        Work objects from OpenAlex API.
+
+    Returns
+    -------
+    pl.DataFrame
+        One row per paper, with the columns of PAPER_SCHEMA.
+    """
+    # load the raw works once and extract every field in a single
+    # columnar pass, rather than walking each work in Python
+    author = pl.element().struct.field("author")
+    return (
+        pl.from_dicts(works, schema=WORK_SCHEMA)
+        .select(
+            id=pl.col("id"),
+            title=pl.col("title").fill_null("No title"),
+            authors=pl.col("authorships")
+            .list.head(5)
+            .list.eval(
+                author.filter(author.is_not_null())
+                .struct.field("display_name")
+                .fill_null("Unknown")
+            )
+            .list.join(", ")
+            .replace("", "Unknown")
+            .fill_null("Unknown"),
+            year=pl.col("publication_year"),
+            citations=pl.col("cited_by_count").fill_null(0),
+            doi=pl.col("doi"),
+            url=pl.col("doi"),
+            open_access=pl.col("open_access")
+            .struct.field("is_oa")
+            .fill_null(False),
+            source=pl.col("primary_location")
+            .struct.field("source")
+            .struct.field("display_name")
+            .fill_null("Unknown"),
         )
+        .cast(PAPER_SCHEMA)
+    )
 
-        return {
-            "rate_limit_limit": limit,
-            "rate_limit_remaining": remaining,
-            "email_used": email,
-            "has_email": bool(user_email),
-        }
-    except Exception as e:
-        return {
-            "error": str(e),
-            "email_used": email,
-            "has_email": bool(user_email),
-        }
 
+def build_works_params(
+    filters: list[str],
+    limit: int,
+    min_year: int | None,
+    max_year: int | None,
+    min_citations: int | None,
+    open_access_only: bool,
+) -> dict[str, str | int]:
+    """
+    Build the query parameters for the top cited works matching
+    the given filters.
 
-def extract_paper_info(work: dict) -> dict:
+    Parameters
+    ----------
+    filters : list[str]
+        OpenAlex filters to apply besides the ones below.
+    limit : int
+        Number of results to return.
+    min_year : int | None
+        Minimum publication year.
+    max_year : int | None
+        Maximum publication year.
+    min_citations : int | None
+        Minimum citation count.
+    open_access_only : bool
+        Only return open access papers.
+
+    Returns
+    -------
+    dict[str, str | int]
+        Query parameters for the OpenAlex works endpoint.
     """
-    Extract relevant fields from a work object.
+    filters = list(filters)
+    if min_year:
+        filters.append(f"from_publication_date:{min_year}-01-01")
+    if max_year:
+        filters.append(f"to_publication_date:{max_year}-12-31")
+    if open_access_only:
+        filters.append("is_oa:true")
+    if min_citations:
+        filters.append(f"cited_by_count:>{min_citations - 1}")
+
+    params = {
+        "sort": "cited_by_count:desc",
+        "select": ",".join(WORK_FIELDS),
+        "per-page": min(limit, 200),
+    }
+    if filters:
+        params["filter"] = ",".join(filters)
+    return params
+
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=128, show_spinner=False)
+def search_papers_cached(
+    keyword: str,
+    limit: int,
+    min_year: int | None,
+    max_year: int | None,
+    min_citations: int | None,
+    open_access_only: bool,
+    email: str,
+) -> pl.DataFrame:
+    """
+    Search OpenAlex for top cited papers by keyword. Only depends
+    on its arguments, so results are cached for a day.
 
     Parameters
     ----------
-    work : dict
-        Work object from OpenAlex API.
+    keyword : str
+        Search keyword.
+    limit : int
+        Number of results to return.
+    min_year : int | None
+        Minimum publication year.
+    max_year : int | None
+        Maximum publication year.
+    min_citations : int | None
+        Minimum citation count.
+    open_access_only : bool
+        Only return open access papers.
+    email : str
+        Email for polite pool access.
 
     Returns
     -------
-    dict
-        Extracted paper information.
+    pl.DataFrame
+        DataFrame of papers.
     """
-    authors = [
-        authorship.get("author", {}).get("display_name", "Unknown")
-        for authorship in work.get("authorships", [])[:5]
-        if authorship.get("author")
-    ]
+    # build query, sorted by citations, and get results
+    params = build_works_params(
+        [], limit, min_year, max_year, min_citations, open_access_only
+    )
+    params["search"] = keyword
+    results = fetch_openalex(OPENALEX_WORKS_URL, params=params, email=email)
 
-    # handle None values for nested dicts
-    open_access_data = work.get("open_access") or {}
-    primary_location = work.get("primary_location") or {}
-    source = primary_location.get("source") or {}
+    # extract information from at most the requested number of works
+    return build_papers_frame(results[:limit])
 
+
+def get_rate_limit_info(user_email: str | None, from_cache: bool) -> dict:
+    """
+    Describe the current OpenAlex access for display: the email sent
+    and the rate limit information of the latest response for it.
+
+    Parameters
+    ----------
+    user_email : str | None
+        User email for polite pool access.
+    from_cache : bool
+        Whether the search was answered from the cache, without
+        sending any request.
+
+    Returns
+    -------
+    dict
+        Rate limit info dict.
+    """
+    email = user_email or DEFAULT_EMAIL
     return {
-        "title": work.get("title", "No title"),
-        "authors": ", ".join(authors) if authors else "Unknown",
-        "year": work.get("publication_year"),
-        "citations": work.get("cited_by_count", 0),
-        "doi": work.get("doi"),
-        "url": work.get("doi") if work.get("doi") else None,
-        "open_access": open_access_data.get("is_oa", False),
-        "source": source.get("display_name", "Unknown"),
+        **get_rate_limit_status().get(email, {}),
+        "email_used": email,
+        "has_email": bool(user_email),
+        "from_cache": from_cache,
     }
 
 
@@ -170,7 +430,7 @@ def search_papers(
     min_citations: int | None = None,
     open_access_only: bool = False,
     user_email: str | None = None,
-) -> list[dict]:
+) -> tuple[pl.DataFrame, dict]:
     """
     Search OpenAlex for top cited papers by keyword.
 
@@ -193,41 +453,104 @@ def search_papers(
 
     Returns
     -------
-    list[dict]
-        List of paper dicts.
+    tuple[pl.DataFrame, dict]
+        DataFrame of papers and rate limit info dict.
     """
-    # set email for this request
-    if user_email:
-        config.email = user_email
-    else:
-        config.email = os.environ.get("OPENALEX_EMAIL", "research@example.com")
+    sent = getattr(sent_requests, "count", 0)
+    papers = search_papers_cached(
+        keyword,
+        limit,
+        min_year,
+        max_year,
+        min_citations,
+        open_access_only,
+        user_email or DEFAULT_EMAIL,
+    )
+    from_cache = getattr(sent_requests, "count", 0) == sent
+    return papers, get_rate_limit_info(user_email, from_cache)
 
-    # build query
-    query = Works().search(keyword)
 
-    # apply filters
-    if min_year:
-        query = query.filter(from_publication_date=f"{min_year}-01-01")
-    if max_year:
-        query = query.filter(to_publication_date=f"{max_year}-12-31")
-    if open_access_only:
-        query = query.filter(is_oa=True)
+@st.cache_data(ttl=24 * 60 * 60, max_entries=128, show_spinner=False)
+def search_papers_by_author_cached(
+    author_name: str,
+    limit: int,
+    min_year: int | None,
+    max_year: int | None,
+    min_citations: int | None,
+    open_access_only: bool,
+    email: str,
+) -> tuple[pl.DataFrame, dict | None]:
+    """
+    Search OpenAlex for top cited papers by author name. Only
+    depends on its arguments, so results are cached for a day.
 
-    # sort by citations and get results
-    fetch_limit = limit * 3 if min_citations else limit
-    results = query.sort(cited_by_count="desc").get(
-        per_page=min(fetch_limit, 200)
+    Parameters
+    ----------
+    author_name : str
+        Author name to search for.
+    limit : int
+        Number of results to return.
+    min_year : int | None
+        Minimum publication year.
+    max_year : int | None
+        Maximum publication year.
+    min_citations : int | None
+        Minimum citation count.
+    open_access_only : bool
+        Only return open access papers.
+    email : str
+        Email for polite pool access.
+
+    Returns
+    -------
+    tuple[pl.DataFrame, dict | None]
+        DataFrame of papers and author info dict (or None if not
+        found).
+    """
+    # search for the author
+    author_results = fetch_openalex(
+        OPENALEX_AUTHORS_URL,
+        params={
+            "search": author_name,
+            "select": ",".join(AUTHOR_FIELDS),
+            "per-page": 1,
+        },
+        email=email,
     )
 
-    # extract information from all works
-    papers = [extract_paper_info(work) for work in results]
+    if not author_results:
+        return build_papers_frame([]), None
 
-    # apply client-side citation filter if needed
-    if min_citations:
-        papers = [p for p in papers if p["citations"] >= min_citations]
+    # get the top matching author
+    author = author_results[0]
+    author_id = author.get("id")
 
-    # return only requested number
-    return papers[:limit]
+    # extract author info for display
+    institutions = author.get("last_known_institutions") or []
+    author_info = {
+        "display_name": author.get("display_name", "Unknown"),
+        "works_count": author.get("works_count", 0),
+        "cited_by_count": author.get("cited_by_count", 0),
+        "last_known_institution": institutions[0].get("display_name")
+        if institutions
+        else None,
+        "orcid": author.get("orcid"),
+    }
+
+    # build query for this author's works, sorted by citations, and
+    # get results
+    params = build_works_params(
+        [f"author.id:{author_id}"],
+        limit,
+        min_year,
+        max_year,
+        min_citations,
+        open_access_only,
+    )
+    results = fetch_openalex(OPENALEX_WORKS_URL, params=params, email=email)
+
+    # extract information from at most the requested number of works
+    return build_papers_frame(results[:limit]), author_info
 
 
 def search_papers_by_author(
@@ -238,7 +561,7 @@ def search_papers_by_author(
     min_citations: int | None = None,
     open_access_only: bool = False,
     user_email: str | None = None,
-) -> tuple[list[dict], dict | None]:
+) -> tuple[pl.DataFrame, dict | None, dict]:
     """
     Search OpenAlex for top cited papers by author name.
 
@@ -261,64 +584,101 @@ def search_papers_by_author(
 
     Returns
     -------
-    tuple[list[dict], dict | None]
-        List of paper dicts and author info dict (or None if not found).
+    tuple[pl.DataFrame, dict | None, dict]
+        DataFrame of papers, author info dict (or None if not found),
+        and rate limit info dict.
     """
-    # set email for this request
-    if user_email:
-        config.email = user_email
-    else:
-        config.email = os.environ.get("OPENALEX_EMAIL", "research@example.com")
+    sent = getattr(sent_requests, "count", 0)
+    papers, author_info = search_papers_by_author_cached(
+        author_name,
+        limit,
+        min_year,
+        max_year,
+        min_citations,
+        open_access_only,
+        user_email or DEFAULT_EMAIL,
+    )
+    from_cache = getattr(sent_requests, "count", 0) == sent
+    return papers, author_info, get_rate_limit_info(user_email, from_cache)
 
-    # search for the author
-    author_results = Authors().search(author_name).get(per_page=1)
 
-    if not author_results:
-        return [], None
+def search_papers_by_keywords(
+    keywords: list[str],
+    limit: int = 25,
+    min_year: int | None = None,
+    max_year: int | None = None,
+    min_citations: int | None = None,
+    open_access_only: bool = False,
+    user_email: str | None = None,
+) -> tuple[pl.DataFrame, dict]:
+    """
+    Search OpenAlex for top cited papers across several keywords,
+    issuing one request per keyword concurrently and merging the
+    results by citation count. With several keywords, a "keywords"
+    column lists the keywords that matched each paper.
 
-    # get the top matching author
-    author = author_results[0]
-    author_id = author.get("id")
+    Parameters
+    ----------
+    keywords : list[str]
+        Search keywords; at most MAX_KEYWORDS, so that the requests
+        sent at once stay within OpenAlex's rate limit.
+    limit : int
+        Number of results to return.
+    min_year : int | None
+        Minimum publication year.
+    max_year : int | None
+        Maximum publication year.
+    min_citations : int | None
+        Minimum citation count.
+    open_access_only : bool
+        Only return open access papers.
+    user_email : str | None
+        User email for polite pool access.
 
-    # extract author info for display
-    author_info = {
-        "display_name": author.get("display_name", "Unknown"),
-        "works_count": author.get("works_count", 0),
-        "cited_by_count": author.get("cited_by_count", 0),
-        "last_known_institution": author.get("last_known_institution", {}).get(
-            "display_name"
-        )
-        if author.get("last_known_institution")
-        else None,
-        "orcid": author.get("orcid"),
+    Returns
+    -------
+    tuple[pl.DataFrame, dict]
+        DataFrame of papers and rate limit info dict.
+    """
+    search_kwargs = {
+        "limit": limit,
+        "min_year": min_year,
+        "max_year": max_year,
+        "min_citations": min_citations,
+        "open_access_only": open_access_only,
+        "user_email": user_email,
     }
+    if len(keywords) == 1:
+        return search_papers(keywords[0], **search_kwargs)
+
+    # one worker per keyword, so every request is sent at once
+    with ThreadPoolExecutor(max_workers=len(keywords)) as executor:
+        searches = list(
+            executor.map(
+                lambda keyword: search_papers(keyword, **search_kwargs),
+                keywords,
+            )
+        )
 
-    # build query for this author's works
-    query = Works().filter(author={"id": author_id})
-
-    # apply filters
-    if min_year:
-        query = query.filter(from_publication_date=f"{min_year}-01-01")
-    if max_year:
-        query = query.filter(to_publication_date=f"{max_year}-12-31")
-    if open_access_only:
-        query = query.filter(is_oa=True)
-
-    # sort by citations and get results
-    fetch_limit = limit * 3 if min_citations else limit
-    results = query.sort(cited_by_count="desc").get(
-        per_page=min(fetch_limit, 200)
+    # merge results, keeping each paper once along with every
+    # keyword that matched it
+    papers = (
+        pl.concat(
+            [
+                keyword_papers.with_columns(keywords=pl.lit(keyword))
+                for keyword, (keyword_papers, _) in zip(
+                    keywords, searches, strict=True
+                )
+            ]
+        )
+        .with_columns(pl.col("keywords").str.join(", ").over("id"))
+        .filter(pl.col("id").is_first_distinct())
+        .sort("citations", descending=True, maintain_order=True)
+        .head(limit)
     )
 
-    # extract information from all works
-    papers = [extract_paper_info(work) for work in results]
-
-    # apply client-side citation filter if needed
-    if min_citations:
-        papers = [p for p in papers if p["citations"] >= min_citations]
-
-    # return only requested number
-    return papers[:limit], author_info
+    from_cache = all(info["from_cache"] for _, info in searches)
+    return papers, get_rate_limit_info(user_email, from_cache)
 
 
 def display_pool_status(rate_limit_info: dict):
@@ -330,56 +690,418 @@ def display_pool_status(rate_limit_info: dict):
     limit = rate_limit_info.get("rate_limit_limit", "unknown")
     remaining = rate_limit_info.get("rate_limit_remaining", "unknown")
     email = rate_limit_info.get("email_used", "")
+    checked_at = rate_limit_info.get("checked_at", "unknown")
+    cache_note = (
+        "\n♻️ Results from cache; no request was sent for this search."
+        if rate_limit_info.get("from_cache")
+        else ""
+    )
 
     if has_email:
         st.success(f"""
 **✓ Polite Pool - Email Sent to OpenAlex**
 Email: `{email}`
 OpenAlex Rate Limit: **{limit}** requests/sec | Remaining: **{remaining}**
+(as of {checked_at}){cache_note}
 📧 Your email is going to OpenAlex for better performance.
         """)
     else:
         st.warning(f"""
 **⚠ Common Pool - No Email Provided**
 Rate Limit: **{limit}** requests/sec | Remaining: **{remaining}**
+(as of {checked_at}){cache_note}
 💡 Add your email (see sidebar) for the polite pool with better response times.
         """)
 
 
-# main app layout
-# load custom font
-bebas_font_base64 = load_font_base64("assets/fonts/BebasNeue-Regular.ttf")
-font_css = (
-    f"""
-<style>
+@st.cache_data(max_entries=128, show_spinner=False)
+def build_download_data(
+    papers: pl.DataFrame, search_context: str, generated: str
+) -> tuple[str, str, bytes]:
+    """
+    Build the titles text, full text, and CSV downloads for a set of
+    search results.
+
+    Parameters
+    ----------
+    papers : pl.DataFrame
+        DataFrame of papers, as returned by the search functions.
+    search_context : str
+        Description of the search, used in the text file headers.
+    generated : str
+        Time of the search, used in the text file headers.
+
+    Returns
+    -------
+    tuple[str, str, bytes]
+        Titles text, full text, and CSV content.
+    """
+    # derive all download formats from one lazy query
+    ranked = papers.lazy().with_row_index("rank", offset=1)
+    open_access_label = (
+        pl.when(pl.col("open_access"))
+        .then(pl.lit("Yes"))
+        .otherwise(pl.lit("No"))
+    )
+    # multi-keyword searches record which keywords matched each paper
+    has_keywords = "keywords" in papers.columns
+    titles_lf = ranked.select(
+        pl.format(
+            "{}. {} ({} citations)", "rank", "title", "citations"
+        ).str.join("\n")
+    )
+    full_lf = ranked.select(
+        pl.concat_str(
+            pl.format(
+                "{}. {}\n   Authors: {}\n   Year: {}\n"
+                "   Citations: {}\n   Source: {}\n",
+                "rank",
+                "title",
+                "authors",
+                pl.col("year").cast(pl.String).fill_null("Unknown"),
+                "citations",
+                "source",
+            ),
+            pl.format("   DOI: {}\n", "doi"),
+            pl.format("   URL: {}\n", "url"),
+            pl.format("   Open Access: {}\n", open_access_label),
+            pl.format("   Keywords: {}\n", "keywords")
+            if has_keywords
+            else pl.lit(None, dtype=pl.String),
+            ignore_nulls=True,
+        ).str.join("\n")
+    )
+    csv_lf = ranked.with_columns(
+        open_access_label.alias("open_access")
+    ).select(
+        [
+            "rank",
+            "title",
+            "authors",
+            "year",
+            "citations",
+            "source",
+            "doi",
+            "url",
+            "open_access",
+        ]
+        + (["keywords"] if has_keywords else [])
+    )
+    titles_df, full_df, csv_df = pl.collect_all([titles_lf, full_lf, csv_lf])
+
+    # assemble each file in one pass instead of repeated +=
+    header = f"Top {len(papers)} Papers {search_context}\n"
+
+    # titles only
+    titles_text = "".join(
+        [
+            header,
+            f"Generated: {generated}\n\n",
+            titles_df.item(),
+        ]
+    )
+
+    # full text
+    full_text = "".join(
+        [
+            header,
+            f"Generated: {generated}\n",
+            "=" * 80 + "\n\n",
+            full_df.item(),
+            "\n",
+        ]
+    )
+
+    # write the CSV straight to bytes, the form the download needs
+    csv_buffer = BytesIO()
+    csv_df.write_csv(csv_buffer, include_bom=False)
+
+    return titles_text, full_text, csv_buffer.getvalue()
+
+
+def render_paper_html(rank: int, paper: dict) -> str:
+    """
+    Render one paper of the results list as HTML.
+
+    Parameters
+    ----------
+    rank : int
+        Position of the paper in the results.
+    paper : dict
+        Paper row with the columns of PAPER_SCHEMA.
+
+    Returns
+    -------
+    str
+        HTML for the paper, styled by the classes in build_page_css.
+    """
+    title = escape(paper["title"])
+    if paper["url"]:
+        title = f'<a href="{escape(paper["url"])}" target="_blank">{title}</a>'
+
+    meta = [
+        f"👥 {escape(paper['authors'])}",
+        f"📅 {paper['year'] or 'Unknown'} | 📖 {escape(paper['source'])}",
+    ]
+    if paper["doi"]:
+        meta.append(f"🔗 DOI: {escape(paper['doi'])}")
+    if paper.get("keywords"):
+        meta.append(f"🔍 Keywords: {escape(paper['keywords'])}")
+    meta_html = "".join(f'<div class="paper-meta">{m}</div>' for m in meta)
+
+    open_access_html = (
+        '<div class="paper-open-access">🔓 Open Access</div>'
+        if paper["open_access"]
+        else ""
+    )
+
+    # no newlines or indentation, so markdown keeps it as one html block
+    return (
+        '<div class="paper-row">'
+        '<div class="paper-main">'
+        f'<div class="paper-title">{rank}. {title}</div>'
+        f"{meta_html}"
+        "</div>"
+        '<div class="paper-citations">'
+        '<div class="paper-metric-label">Citations</div>'
+        f'<div class="paper-metric-value">{paper["citations"]}</div>'
+        f"{open_access_html}"
+        "</div>"
+        "</div>"
+    )
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def build_papers_html(papers: pl.DataFrame) -> str:
+    """
+    Render the results list as a single HTML block, so it reaches
+    the browser as one element instead of several widgets per paper.
+
+    Parameters
+    ----------
+    papers : pl.DataFrame
+        DataFrame of papers, as returned by the search functions.
+
+    Returns
+    -------
+    str
+        HTML for all papers.
+    """
+    return "".join(
+        render_paper_html(rank, paper)
+        for rank, paper in enumerate(papers.iter_rows(named=True), 1)
+    )
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def build_papers_table(papers: pl.DataFrame) -> pl.DataFrame:
+    """
+    Arrange the results for display as a table.
+
+    Parameters
+    ----------
+    papers : pl.DataFrame
+        DataFrame of papers, as returned by the search functions.
+
+    Returns
+    -------
+    pl.DataFrame
+        Ranked papers with display column names.
+    """
+    # the link sits in its own column next to the title: a link
+    # column can only derive its label from the url itself, and papers
+    # without a doi would otherwise lose their title
+    columns = {
+        "title": "Title",
+        "url": "Link",
+        "authors": "Authors",
+        "year": "Year",
+        "citations": "Citations",
+        "source": "Source",
+        "open_access": "Open Access",
+        "keywords": "Keywords",
+    }
+    return (
+        papers.with_row_index("Rank", offset=1)
+        .select(["Rank", *(name for name in columns if name in papers)])
+        .rename(columns, strict=False)
+    )
+
+
+@st.fragment
+def display_results():
+    """
+    Display the stored search results. As a fragment, interactions
+    with its widgets rerun only this function, not the whole app.
+    """
+    papers = st.session_state.search_results
+    if papers is None:
+        return
+
+    # show pool status
+    if st.session_state.rate_limit_info:
+        display_pool_status(st.session_state.rate_limit_info)
+
+    # show author info if this was an author search
+    if st.session_state.author_info:
+        author_info = st.session_state.author_info
+        works_count = author_info["works_count"]
+        citations_count = author_info["cited_by_count"]
+        st.info(f"""
+**Author Found:** {author_info["display_name"]}
+**Institution:** {author_info["last_known_institution"] or "Unknown"}
+**Total Works:** {works_count:,} | **Total Citations:** {citations_count:,}
+{f"**ORCID:** {author_info['orcid']}" if author_info["orcid"] else ""}
+        """)
+        st.subheader(
+            f"Found {len(papers)} papers by {author_info['display_name']}"
+        )
+    else:
+        # results header for keyword search
+        st.subheader(f"Found {len(papers)} papers")
+
+    # download buttons
+    if not papers.is_empty():
+        col1, col2, col3 = st.columns(3)
+
+        # determine search context for file headers
+        if st.session_state.author_info:
+            search_context = (
+                f"by {st.session_state.author_info['display_name']}"
+            )
+        else:
+            search_context = "Citation Search Results"
+
+        # reused across reruns while the results are unchanged
+        titles_text, full_text, csv_data = build_download_data(
+            papers, search_context, st.session_state.search_timestamp
+        )
+
+        with col1:
+            st.download_button(
+                "📄 Download Titles (.txt)",
+                data=titles_text,
+                file_name="citation_titles.txt",
+                mime="text/plain",
+            )
+        with col2:
+            st.download_button(
+                "📝 Download Full Data (.txt)",
+                data=full_text,
+                file_name="citation_full.txt",
+                mime="text/plain",
+            )
+        with col3:
+            st.download_button(
+                "📊 Download Full Data (.csv)",
+                data=csv_data,
+                file_name="citation_papers.csv",
+                mime="text/csv",
+            )
+
+    st.divider()
+
+    # display papers; large result sets go in a table, which the
+    # browser renders lazily, instead of one card per paper
+    if len(papers) <= CARD_VIEW_MAX_PAPERS and st.toggle(
+        "Card view", value=True, key="card_view"
+    ):
+        st.markdown(build_papers_html(papers), unsafe_allow_html=True)
+    else:
+        st.dataframe(
+            build_papers_table(papers),
+            column_config={
+                "Link": st.column_config.LinkColumn(display_text="Open"),
+                "Citations": st.column_config.NumberColumn(format="%d"),
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+@st.cache_resource(show_spinner=False)
+def build_page_css(font_path: str) -> str:
+    """
+    Build the page CSS and title markup, embedding the custom font
+    when it is available.
+
+    Parameters
+    ----------
+    font_path : str
+        Path to the font file.
+
+    Returns
+    -------
+    str
+        HTML containing the style block and the title element.
+    """
+    font_base64 = load_font_base64(font_path)
+    if font_base64:
+        font_face = f"""
 @font-face {{
     font-family: 'Bebas Neue';
-    src: url(data:font/ttf;base64,{bebas_font_base64}) format('truetype');
-}}
+    src: url(data:font/ttf;base64,{font_base64}) format('truetype');
+}}"""
+        title_font = "'Bebas Neue', sans-serif"
+    else:
+        font_face = ""
+        title_font = "sans-serif"
+
+    return f"""
+<style>{font_face}
 .custom-title {{
-    font-family: 'Bebas Neue', sans-serif;
+    font-family: {title_font};
     font-size: 3.5rem;
     color: #0d6efd;
     margin-bottom: 0.5rem;
 }}
-</style>
-<div class="custom-title">Citation Search</div>
-"""
-    if bebas_font_base64
-    else """
-<style>
-.custom-title {{
-    font-family: sans-serif;
-    font-size: 3.5rem;
-    color: #0d6efd;
-    margin-bottom: 0.5rem;
+.paper-row {{
+    display: flex;
+    gap: 1rem;
+    padding: 1rem 0;
+    border-bottom: 1px solid rgba(49, 51, 63, 0.2);
+}}
+.paper-main {{
+    flex: 4;
+    min-width: 0;
+}}
+.paper-title {{
+    font-weight: 700;
+    margin-bottom: 0.25rem;
+}}
+.paper-meta {{
+    font-size: 0.875rem;
+    color: rgba(49, 51, 63, 0.6);
+}}
+.paper-citations {{
+    flex: 1;
+}}
+.paper-metric-label {{
+    font-size: 0.875rem;
+}}
+.paper-metric-value {{
+    font-size: 2.25rem;
+    line-height: 1.2;
+}}
+.paper-open-access {{
+    margin-top: 0.5rem;
+    padding: 0.5rem 0.75rem;
+    border-radius: 0.5rem;
+    background-color: rgba(33, 195, 84, 0.1);
+    color: rgb(23, 114, 51);
 }}
 </style>
 <div class="custom-title">Citation Search</div>
 """
-)
 
-st.markdown(font_css, unsafe_allow_html=True)
+
+# main app layout
+# load static content
+markdown_contents = load_markdown_contents()
+
+# load custom font and page styles
+page_css = build_page_css("assets/fonts/BebasNeue-Regular.ttf")
+st.markdown(page_css, unsafe_allow_html=True)
 st.markdown("Find the most cited academic papers by keyword using OpenAlex")
 
 # sidebar for email and filters
@@ -440,33 +1162,49 @@ search_type = st.radio(
     key="search_type_radio",
 )
 
-if search_type == "Keyword":
-    search_input = st.text_input(
-        "Search Keyword",
-        placeholder="e.g., machine learning, CRISPR, climate change",
-        key="keyword_input",
-    )
-else:
-    search_input = st.text_input(
-        "Author Name",
-        placeholder="e.g., Albert Einstein, Marie Curie",
-        key="author_input",
+# typing in the search box only reruns the app once the search is submitted
+with st.form("search_form"):
+    if search_type == "Keyword":
+        search_input = st.text_input(
+            "Search Keyword",
+            placeholder="e.g., machine learning, CRISPR, climate change",
+            key="keyword_input",
+        )
+    else:
+        search_input = st.text_input(
+            "Author Name",
+            placeholder="e.g., Albert Einstein, Marie Curie",
+            key="author_input",
+        )
+
+    # search button
+    submitted = st.form_submit_button(
+        "🔍 Search", type="primary", use_container_width=True
     )
 
-# search button
-if st.button("🔍 Search", type="primary", use_container_width=True):
-    if not search_input:
+if submitted:
+    # search each distinct comma separated keyword once
+    keywords = list(
+        dict.fromkeys(
+            keyword.strip()
+            for keyword in search_input.split(",")
+            if keyword.strip()
+        )
+    )
+    if not (keywords if search_type == "Keyword" else search_input.strip()):
         error_msg = (
             "search keyword" if search_type == "Keyword" else "author name"
         )
         st.error(f"Please enter a {error_msg}")
+    elif search_type == "Keyword" and len(keywords) > MAX_KEYWORDS:
+        st.error(f"Please enter at most {MAX_KEYWORDS} keywords")
     else:
         with st.spinner("Searching OpenAlex..."):
             try:
                 if search_type == "Keyword":
                     # perform keyword search
-                    papers = search_papers(
-                        keyword=search_input,
+                    papers, rate_limit_info = search_papers_by_keywords(
+                        keywords=keywords,
                         limit=limit,
                         min_year=min_year,
                         max_year=max_year,
@@ -479,7 +1217,11 @@ if st.button("🔍 Search", type="primary", use_container_width=True):
                     st.session_state.author_info = None
                 else:
                     # perform author search
-                    papers, author_info = search_papers_by_author(
+                    (
+                        papers,
+                        author_info,
+                        rate_limit_info,
+                    ) = search_papers_by_author(
                         author_name=search_input,
                         limit=limit,
                         min_year=min_year,
@@ -492,192 +1234,41 @@ if st.button("🔍 Search", type="primary", use_container_width=True):
                     )
                     st.session_state.author_info = author_info
 
-                # get rate limit info
-                rate_limit_info = get_openalex_rate_limit_info(
-                    st.session_state.user_email
-                    if st.session_state.user_email
-                    else None
-                )
-
                 # store in session state
                 st.session_state.search_results = papers
                 st.session_state.rate_limit_info = rate_limit_info
                 st.session_state.search_type = search_type
+                st.session_state.search_timestamp = datetime.now().strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                )
 
             except Exception as e:
                 st.error(f"Search failed: {str(e)}")
 
 # search tips
 with st.expander("💡 Search Tips", expanded=False):
-    search_tips_content = load_markdown_content("search_tips.md")
+    search_tips_content = markdown_contents.get("search_tips.md", "")
     if search_tips_content:
         st.markdown(search_tips_content)
 
 # display results
-if st.session_state.search_results is not None:
-    papers = st.session_state.search_results
-
-    # show pool status
-    if st.session_state.rate_limit_info:
-        display_pool_status(st.session_state.rate_limit_info)
-
-    # show author info if this was an author search
-    if st.session_state.author_info:
-        author_info = st.session_state.author_info
-        works_count = author_info["works_count"]
-        citations_count = author_info["cited_by_count"]
-        st.info(f"""
-**Author Found:** {author_info["display_name"]}
-**Institution:** {author_info["last_known_institution"] or "Unknown"}
-**Total Works:** {works_count:,} | **Total Citations:** {citations_count:,}
-{f"**ORCID:** {author_info['orcid']}" if author_info["orcid"] else ""}
-        """)
-        st.subheader(
-            f"Found {len(papers)} papers by {author_info['display_name']}"
-        )
-    else:
-        # results header for keyword search
-        st.subheader(f"Found {len(papers)} papers")
-
-    # download buttons
-    if papers:
-        col1, col2, col3 = st.columns(3)
-
-        # prepare data for downloads
-        df = pl.DataFrame(papers)
-
-        # determine search context for file headers
-        if st.session_state.author_info:
-            search_context = (
-                f"by {st.session_state.author_info['display_name']}"
-            )
-        else:
-            search_context = "Citation Search Results"
-
-        # titles only
-        titles_text = f"Top {len(papers)} Papers {search_context}\n"
-        titles_text += (
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        )
-        titles_text += "\n".join(
-            [
-                f"{i + 1}. {p['title']} ({p['citations']} citations)"
-                for i, p in enumerate(papers)
-            ]
-        )
-
-        # full text
-        full_text = f"Top {len(papers)} Papers {search_context}\n"
-        full_text += (
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        )
-        full_text += "=" * 80 + "\n\n"
-        for i, p in enumerate(papers):
-            full_text += f"{i + 1}. {p['title']}\n"
-            full_text += f"   Authors: {p['authors']}\n"
-            full_text += f"   Year: {p['year'] or 'Unknown'}\n"
-            full_text += f"   Citations: {p['citations']}\n"
-            full_text += f"   Source: {p['source']}\n"
-            if p["doi"]:
-                full_text += f"   DOI: {p['doi']}\n"
-            if p["url"]:
-                full_text += f"   URL: {p['url']}\n"
-            full_text += (
-                f"   Open Access: {'Yes' if p['open_access'] else 'No'}\n\n"
-            )
-
-        # csv
-        csv_df = df.with_row_index("rank", offset=1)
-        csv_df = csv_df.with_columns(
-            pl.col("open_access").map_elements(
-                lambda x: "Yes" if x else "No", return_dtype=pl.String
-            )
-        )
-        csv_df = csv_df.select(
-            [
-                "rank",
-                "title",
-                "authors",
-                "year",
-                "citations",
-                "source",
-                "doi",
-                "url",
-                "open_access",
-            ]
-        )
-
-        with col1:
-            st.download_button(
-                "📄 Download Titles (.txt)",
-                data=titles_text,
-                file_name="citation_titles.txt",
-                mime="text/plain",
-            )
-        with col2:
-            st.download_button(
-                "📝 Download Full Data (.txt)",
-                data=full_text,
-                file_name="citation_full.txt",
-                mime="text/plain",
-            )
-        with col3:
-            st.download_button(
-                "📊 Download Full Data (.csv)",
-                data=csv_df.write_csv(),
-                file_name="citation_papers.csv",
-                mime="text/csv",
-            )
-
-    st.divider()
-
-    # display papers
-    for i, paper in enumerate(papers, 1):
-        with st.container():
-            col_main, col_citations = st.columns([4, 1])
-
-            with col_main:
-                if paper["url"]:
-                    title_link = (
-                        f'**{i}. <a href="{paper["url"]}" '
-                        f'target="_blank">{paper["title"]}</a>**'
-                    )
-                    st.markdown(title_link, unsafe_allow_html=True)
-                else:
-                    st.markdown(
-                        f"**{i}. {paper['title']}**", unsafe_allow_html=True
-                    )
-
-                st.caption(f"👥 {paper['authors']}")
-                st.caption(
-                    f"📅 {paper['year'] or 'Unknown'} | 📖 {paper['source']}"
-                )
-
-                if paper["doi"]:
-                    st.caption(f"🔗 DOI: {paper['doi']}")
-
-            with col_citations:
-                st.metric("Citations", paper["citations"])
-                if paper["open_access"]:
-                    st.success("🔓 Open Access")
-
-            st.divider()
+display_results()
 
 # information section
 with st.expander("ℹ️ About OpenAlex API Access", expanded=False):
-    about_content = load_markdown_content("about_openalex.md")
+    about_content = markdown_contents.get("about_openalex.md", "")
     if about_content:
         st.markdown(about_content)
 
 # comparison section
 with st.expander("📊 Comparing Citation Search APIs", expanded=False):
-    comparison_content = load_markdown_content("api_comparison.md")
+    comparison_content = markdown_contents.get("api_comparison.md", "")
     if comparison_content:
         st.markdown(comparison_content)
 
 # repository and contributing section
 with st.expander("🔗 Repository & Contributing", expanded=False):
-    repository_content = load_markdown_content("repository_info.md")
+    repository_content = markdown_contents.get("repository_info.md", "")
     if repository_content:
         st.markdown(repository_content)
 